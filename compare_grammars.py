@@ -0,0 +1,39 @@
+# compare_grammars.py
+# compares the slr(1) tables and parse work of the stratified expression grammar (grammar1.txt)
+# with the ambiguous one resolved by precedence declarations (grammar4.txt).
+# usage: python compare_grammars.py [seed] [number of terms]
+import sys
+import random
+from grammar import parse_grammar_from_file
+from first_follow import compute_first_sets, compute_follow_sets
+from slr1 import build_lr0_items, build_slr1_table, count_slr1_reductions
+
+DEFAULT_SEED = 27
+DEFAULT_TERM_COUNT = 2000
+
+def generate_expression(random_generator, depth=0):
+    """random expression over i, +, * and parentheses, accepted by both grammars."""
+    choice_value = random_generator.random()
+    if depth > 4 or choice_value < 0.4: return 'i'
+    if choice_value < 0.6: return '(' + generate_expression(random_generator, depth + 1) + ')'
+    return generate_expression(random_generator, depth + 1) + random_generator.choice('+*') + generate_expression(random_generator, depth + 1)
+
+def main():
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SEED
+    term_count = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TERM_COUNT
+    random_generator = random.Random(seed)
+    expression = '+'.join(generate_expression(random_generator) for _ in range(term_count))
+    print(f"Input: seed {seed}, {term_count} terms, {len(expression)} tokens")
+    print("| Grammar | LR(0) states | ACTION entries | GOTO entries | Reductions per token |")
+    print("|---|---|---|---|---|")
+    for file_name in ['grammar1.txt', 'grammar4.txt']:
+        grammar_object = parse_grammar_from_file(file_name)
+        follow_sets_dict = compute_follow_sets(grammar_object, compute_first_sets(grammar_object))
+        lr0_states_list, lr0_goto_map, augmented_list = build_lr0_items(grammar_object)
+        action_table, goto_table, is_slr1 = build_slr1_table(grammar_object, follow_sets_dict, lr0_states_list, lr0_goto_map, augmented_list)
+        accepted, reduction_count, token_count = count_slr1_reductions(expression, grammar_object, action_table, goto_table)
+        if not (is_slr1 and accepted): print(f"{file_name}: not SLR(1) or input rejected"); continue
+        print(f"| `{file_name}` | {len(lr0_states_list)} | {len(action_table)} | {len(goto_table)} | {reduction_count / token_count:.2f} |")
+
+if __name__ == "__main__":
+    main()
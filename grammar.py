@@ -13,6 +13,8 @@ class Grammar:
         self.start_symbol = None
         self.productions_list = []
         self.original_productions_list = []
+        #terminal -> (precedence level, associativity); later declarations bind tighter
+        self.precedence_map = dict()
 
     def add_production(self, nonterminal_symbol, alternative_string):
         self.nonterminals.add(nonterminal_symbol)
@@ -45,6 +47,25 @@ class Grammar:
             self.productions_map[nonterminal_symbol].append(rhs_tuple)
             self.productions_list.append((nonterminal_symbol, rhs_tuple))
 
+    def add_precedence_declaration(self, associativity, terminal_symbols):
+        if associativity not in ('left', 'right', 'nonassoc'):
+            raise ValueError(f"Unknown associativity '{associativity}'.")
+        precedence_level = len(set(level for level, _ in self.precedence_map.values())) + 1
+        for terminal_symbol in terminal_symbols:
+            #declarations come after the productions, so the terminals are already known
+            if terminal_symbol == 'e' or terminal_symbol not in self.terminals:
+                raise ValueError(f"'{terminal_symbol}' in precedence declaration is not a terminal of the grammar.")
+            if terminal_symbol in self.precedence_map:
+                raise ValueError(f"Precedence of '{terminal_symbol}' declared more than once.")
+            self.precedence_map[terminal_symbol] = (precedence_level, associativity)
+
+    def get_production_precedence(self, rhs_tuple):
+        #a production takes the precedence of its rightmost terminal that has one
+        for symbol in reversed(rhs_tuple):
+            if symbol in self.precedence_map:
+                return self.precedence_map[symbol]
+        return None
+
     def finalize(self):
         if not self.start_symbol: raise ValueError("Could not determine start symbol.")
         self.terminals.add('$')
@@ -65,6 +86,10 @@ class Grammar:
         for index, (nonterminal, rhs_tuple) in enumerate(production_list_to_print):
              rhs_string_representation = ''.join(rhs_tuple) if rhs_tuple != ('e',) else 'e'
              output_string += f"  {index}: {nonterminal} -> {rhs_string_representation}\n"
+        if self.precedence_map:
+            output_string += "Precedence (lowest first):\n"
+            for terminal_symbol, (level, associativity) in sorted(self.precedence_map.items(), key=lambda item: item[1][0]):
+                output_string += f"  {level}: {terminal_symbol} ({associativity})\n"
         return output_string
 
 def process_production_line(line_text, grammar_object):
@@ -89,6 +114,14 @@ def process_production_line(line_text, grammar_object):
     except Exception:
         return False
 
+def process_precedence_line(line_text, grammar_object):
+    #declarations look like '%left + *', one precedence level per line
+    parts = line_text.split()
+    if not parts or not parts[0].startswith('%'): return False
+    if len(parts) < 2: raise ValueError(f"Precedence declaration without terminals: '{line_text}'")
+    grammar_object.add_precedence_declaration(parts[0][1:], parts[1:])
+    return True
+
 def parse_grammar_interactively():
     grammar_object = Grammar()
     while True:
@@ -134,11 +167,16 @@ def parse_grammar_from_file(file_path):
 
             lines_read_count = 0
             for i, current_line in enumerate(file_handle):
-                if lines_read_count >= num_nonterminals: break
                 current_line = current_line.strip()
-                if current_line:
-                    if process_production_line(current_line, grammar_object):
-                        lines_read_count += 1
+                if not current_line: continue
+                if lines_read_count >= num_nonterminals:
+                    #optional precedence declarations follow the productions
+                    if not process_precedence_line(current_line, grammar_object):
+                        raise ValueError(f"Unexpected line '{current_line}' after the {num_nonterminals} production lines; only precedence declarations may follow them.")
+                elif current_line.startswith('%'):
+                    raise ValueError(f"Precedence declaration '{current_line}' found before all {num_nonterminals} production lines; declarations must follow the productions.")
+                elif process_production_line(current_line, grammar_object):
+                    lines_read_count += 1
 
             if lines_read_count < num_nonterminals:
                  print(f"Warning: Expected {num_nonterminals} productions, but only found {lines_read_count}.", file=sys.stderr)
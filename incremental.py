@@ -0,0 +1,191 @@
+# incremental.py
+# incremental re-parsing of edited inputs for the ll(1) and slr(1) parsers.
+# a parse keeps checkpoints of the parsing stack at token positions. after an edit the
+# parser restarts from the nearest checkpoint before the edit and stops as soon as its
+# stack matches the stack saved (before the edit) at the same point of the unchanged suffix.
+from ll1 import ll1_parse_step
+from slr1 import slr1_parse_step
+
+DEFAULT_CHECKPOINT_INTERVAL = 16
+
+class LinkedStack:
+    """parsing stack kept as (value, parent node, depth) nodes. nodes are never modified,
+    so a checkpoint only stores the top node and shares the rest of the stack."""
+    def __init__(self, top_node=None):
+        self.top_node = top_node
+
+    def __len__(self):
+        return self.top_node[2] if self.top_node is not None else 0
+
+    def __getitem__(self, index):
+        if index != -1 or self.top_node is None: raise IndexError("LinkedStack only supports reading the top.")
+        return self.top_node[0]
+
+    def append(self, value):
+        self.top_node = (value, self.top_node, len(self) + 1)
+
+    def pop(self):
+        value = self[-1]
+        self.top_node = self.top_node[1]
+        return value
+
+    def __delitem__(self, index):
+        #only 'del stack[-n:]' is needed by the parse step functions
+        if not isinstance(index, slice) or index.stop is not None or index.start is None or index.start > 0:
+            raise IndexError("LinkedStack only supports deleting from the top.")
+        for _ in range(-index.start):
+            self.pop()
+
+def build_stack_node(stack_values):
+    top_node = None
+    for depth, value in enumerate(stack_values, start=1):
+        top_node = (value, top_node, depth)
+    return top_node
+
+def same_stack_nodes(first_node, second_node):
+    """compares two stacks, stopping at the first node both share."""
+    while first_node is not second_node:
+        if first_node is None or second_node is None: return False
+        if first_node[2] != second_node[2] or first_node[0] != second_node[0]: return False
+        first_node, second_node = first_node[1], second_node[1]
+    return True
+
+class IncrementalParser:
+    def __init__(self, parse_step_function, initial_stack, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+        if checkpoint_interval <= 0: raise ValueError("Checkpoint interval must be > 0.")
+        self.parse_step_function = parse_step_function
+        self.initial_stack_node = build_stack_node(initial_stack)
+        self.checkpoint_interval = checkpoint_interval
+        self.token_list = ['$']
+        # checkpoints are kept like a gap buffer around the last edit. a checkpoint at position p
+        # holds the top of the stack right after the token before p was shifted (it only depends
+        # on that prefix). left_positions is ascending and holds checkpoints of the current parse
+        # before the gap. the right lists hold checkpoints after the gap as distances from the end
+        # of token_list, so an edit does not move them; they are ordered from the farthest to the
+        # nearest, which keeps right_distances ascending and the nearest checkpoint at the end
+        self.left_positions = [0]
+        self.left_nodes = [self.initial_stack_node]
+        self.right_distances = []
+        self.right_nodes = []
+        # a right checkpoint belongs to the parse (group) that recorded it and leads to its outcome.
+        # those of current_group lie on the current parse and are the nearest ones; the others come
+        # from earlier parses that stopped at an error before reaching them, and are only used to
+        # detect that a later parse has caught up again
+        self.right_outcomes = []
+        self.right_groups = []
+        self.current_group = 0
+        self.result = False
+        self.last_reparsed_token_count = 0
+        #checkpoint entries moved, added or dropped by the last parse or edit
+        self.last_touched_checkpoint_count = 0
+
+    def parse(self, input_string):
+        """parses input_string from scratch and records its checkpoints."""
+        self.token_list = list(input_string.strip()) + ['$']
+        self.left_positions = [0]
+        self.left_nodes = [self.initial_stack_node]
+        self.right_distances, self.right_nodes, self.right_outcomes, self.right_groups = [], [], [], []
+        self.current_group += 1
+        self.last_touched_checkpoint_count = 0
+        self.result, stop_position = self._run(0, self.initial_stack_node)
+        self.last_reparsed_token_count = stop_position
+        return self.result
+
+    def apply_edit(self, edit_start, edit_end, replacement_text):
+        """replaces the tokens [edit_start, edit_end) of the current input with replacement_text
+        and re-parses only as much of the input as the edit requires."""
+        input_length = len(self.token_list) - 1
+        if not (0 <= edit_start <= edit_end <= input_length):
+            raise ValueError(f"Invalid edit range [{edit_start}, {edit_end}) for input of length {input_length}.")
+        self.last_touched_checkpoint_count = 0
+        self._move_gap(edit_start, edit_end)
+        self.token_list[edit_start:edit_end] = list(replacement_text)
+
+        # the nearest checkpoint at or before the edit depends only on unchanged tokens. the right
+        # checkpoints of the current parse now lead to the result from before the edit, which is
+        # what they already store, and the re-parse starts a new group
+        restart_position = self.left_positions[-1]
+        self.current_group += 1
+        accepted, stop_position = self._run(restart_position, self.left_nodes[-1])
+        if accepted is None:
+            # the parse caught up with a right checkpoint; from there on it is the parse that
+            # recorded it, so the checkpoints of its group lie on the current parse again
+            accepted = self.right_outcomes[-1]
+            self.current_group = self.right_groups[-1]
+            self._pop_right()
+        else:
+            # right checkpoints the parse went past without matching are dropped
+            while self.right_distances and len(self.token_list) - self.right_distances[-1] <= stop_position:
+                self._pop_right()
+        self.result = accepted
+        self.last_reparsed_token_count = stop_position - restart_position
+        return self.result
+
+    def _move_gap(self, edit_start, edit_end):
+        """moves the gap so that the left checkpoints are those at or before edit_start and the
+        right ones those at or after edit_end. checkpoints in between are dropped, as are
+        sync-only checkpoints that end up before the edit."""
+        token_count = len(self.token_list)
+        while self.left_positions[-1] > edit_start:
+            checkpoint_position = self.left_positions.pop()
+            checkpoint_node = self.left_nodes.pop()
+            self.last_touched_checkpoint_count += 1
+            if checkpoint_position >= edit_end:
+                self.right_distances.append(token_count - checkpoint_position)
+                self.right_nodes.append(checkpoint_node)
+                self.right_outcomes.append(self.result)
+                self.right_groups.append(self.current_group)
+        while self.right_distances and token_count - self.right_distances[-1] < edit_end:
+            checkpoint_position = token_count - self.right_distances[-1]
+            is_current_parse = self.right_groups[-1] == self.current_group
+            checkpoint_node = self._pop_right()
+            if is_current_parse and checkpoint_position <= edit_start:
+                self.left_positions.append(checkpoint_position)
+                self.left_nodes.append(checkpoint_node)
+
+    def _pop_right(self):
+        self.right_distances.pop()
+        self.right_outcomes.pop()
+        self.right_groups.pop()
+        self.last_touched_checkpoint_count += 1
+        return self.right_nodes.pop()
+
+    def _run(self, input_pointer, start_node):
+        """drives the parse step function from input_pointer, adding left checkpoints, until it
+        finishes or its stack matches a right checkpoint. returns (accepted, stop_position);
+        accepted is None when a right checkpoint was matched, and that checkpoint is then the
+        last right one (those before it have been dropped)."""
+        parsing_stack = LinkedStack(start_node)
+        last_checkpoint_position = input_pointer
+        token_count = len(self.token_list)
+        while True:
+            outcome = self.parse_step_function(parsing_stack, self.token_list, input_pointer)
+            if outcome == 'continue': continue
+            if outcome != 'shift': return outcome == 'accept', input_pointer
+            input_pointer += 1
+
+            # right checkpoints are visited in order, so each one is looked at once
+            while self.right_distances and token_count - self.right_distances[-1] < input_pointer:
+                self._pop_right()
+            if self.right_distances and token_count - self.right_distances[-1] == input_pointer:
+                if same_stack_nodes(parsing_stack.top_node, self.right_nodes[-1]):
+                    self.left_positions.append(input_pointer)
+                    self.left_nodes.append(self.right_nodes[-1])
+                    self.last_touched_checkpoint_count += 1
+                    return None, input_pointer
+
+            if input_pointer - last_checkpoint_position >= self.checkpoint_interval:
+                self.left_positions.append(input_pointer)
+                self.left_nodes.append(parsing_stack.top_node)
+                self.last_touched_checkpoint_count += 1
+                last_checkpoint_position = input_pointer
+
+def create_ll1_incremental_parser(grammar_object, ll1_parsing_table, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+    def parse_step(parsing_stack, token_list, input_pointer):
+        return ll1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, ll1_parsing_table)
+    return IncrementalParser(parse_step, ['$', grammar_object.start_symbol], checkpoint_interval)
+
+def create_slr1_incremental_parser(grammar_object, action_table_arg, goto_table_arg, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+    def parse_step(parsing_stack, token_list, input_pointer):
+        return slr1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, action_table_arg, goto_table_arg)
+    return IncrementalParser(parse_step, [0], checkpoint_interval)
@@ -33,6 +33,32 @@ def build_ll1_table(grammar_object, first_sets_dict, follow_sets_dict):
 
     return ll1_parsing_table, is_ll1_grammar and not conflict_detected
 
+def ll1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, ll1_parsing_table):
+    """performs one move of the ll(1) parser on parsing_stack (modified in place).
+    returns 'shift' when the current token was matched, 'continue' after an expansion,
+    'accept' or 'reject' when the parse is finished."""
+    if not parsing_stack:
+        return 'accept' if input_pointer == len(token_list) else 'reject'
+    stack_top_symbol = parsing_stack[-1]
+    current_input_token = token_list[input_pointer] if input_pointer < len(token_list) else '$'
+
+    if stack_top_symbol == 'e': parsing_stack.pop(); return 'continue'
+
+    if stack_top_symbol in grammar_object.terminals or stack_top_symbol == '$':
+        if stack_top_symbol != current_input_token: return 'reject'
+        parsing_stack.pop()
+        return 'shift'
+    if stack_top_symbol not in grammar_object.nonterminals: return 'reject'
+
+    table_entry_value = ll1_parsing_table.get(stack_top_symbol, {}).get(current_input_token)
+    if table_entry_value is None or table_entry_value == 'conflict': return 'reject'
+    parsing_stack.pop()
+    nonterminal_head, rhs_tuple = grammar_object.original_productions_list[table_entry_value]
+    if rhs_tuple != ('e',):
+        for i in range(len(rhs_tuple) - 1, -1, -1):
+            parsing_stack.append(rhs_tuple[i])
+    return 'continue'
+
 def parse_ll1(input_string, grammar_object, ll1_parsing_table):
     token_list = []
     for char_symbol in input_string.strip(): token_list.append(char_symbol)
@@ -41,34 +67,7 @@ def parse_ll1(input_string, grammar_object, ll1_parsing_table):
     parsing_stack = ['$',grammar_object.start_symbol]
     input_pointer =0
 
-    while len(parsing_stack) > 0:
-        stack_top_symbol = parsing_stack[-1]
-        current_input_token = token_list[input_pointer] if input_pointer < len(token_list) else '$'
-
-        if stack_top_symbol == 'e': parsing_stack.pop(); continue
-
-        if stack_top_symbol in grammar_object.terminals or stack_top_symbol == '$':
-            if stack_top_symbol == current_input_token:
-                parsing_stack.pop()
-                input_pointer += 1
-            else:
-                return False
-        elif stack_top_symbol in grammar_object.nonterminals:
-            table_entry_value = None
-            if stack_top_symbol in ll1_parsing_table and current_input_token in ll1_parsing_table[stack_top_symbol]:
-                table_entry_value = ll1_parsing_table[stack_top_symbol][current_input_token]
-
-            if table_entry_value is not None:
-                if table_entry_value == 'conflict': return False
-                production_index_to_use = table_entry_value
-                parsing_stack.pop()
-                nonterminal_head, rhs_tuple = grammar_object.original_productions_list[production_index_to_use]
-                if rhs_tuple != ('e',):
-                    for i in range(len(rhs_tuple) - 1, -1, -1):
-                        parsing_stack.append(rhs_tuple[i])
-            else:
-                return False
-        else:
-            return False
-
-    return input_pointer == len(token_list)
\ No newline at end of file
+    while True:
+        step_outcome = ll1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, ll1_parsing_table)
+        if step_outcome == 'shift': input_pointer += 1
+        elif step_outcome != 'continue': return step_outcome == 'accept'
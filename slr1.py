@@ -57,12 +57,32 @@ def build_lr0_items(grammar_object):
     return states_list, goto_transitions_map, augmented_list
 #End of build_lr0_items 
 
+def resolve_shift_reduce_conflict(grammar_object, lookahead_terminal, shift_action, reduce_action):
+    """resolves a shift/reduce clash with the precedence declarations of the grammar.
+    returns the winning action, ('error', 'Nonassoc') for a nonassociative operator,
+    or None when the declarations do not decide it."""
+    terminal_precedence = grammar_object.precedence_map.get(lookahead_terminal)
+    nonterminal_head, rhs_tuple = grammar_object.original_productions_list[reduce_action[1]]
+    production_precedence = grammar_object.get_production_precedence(rhs_tuple)
+    if terminal_precedence is None or production_precedence is None: return None
+    if production_precedence[0] > terminal_precedence[0]: return reduce_action
+    if production_precedence[0] < terminal_precedence[0]: return shift_action
+    associativity = terminal_precedence[1]
+    if associativity == 'left': return reduce_action
+    if associativity == 'right': return shift_action
+    return ('error', 'Nonassoc')
+
 def build_slr1_table(grammar_object, follow_sets_dict, lr0_states_list, lr0_goto_map, augmented_productions_list):
     action_table = dict()
     goto_table = dict()
     is_slr1_grammar = True
-    conflict_detected = False
-    augmented_start_symbol = grammar_object.start_symbol + "'"
+    #every action proposed for a table entry, resolved once all items have been seen
+    candidate_actions_map = dict()
+
+    def add_candidate_action(action_table_key, new_action_tuple):
+        candidate_actions_list = candidate_actions_map.setdefault(action_table_key, [])
+        if new_action_tuple not in candidate_actions_list:
+            candidate_actions_list.append(new_action_tuple)
 
     for state_index, current_item_set in enumerate(lr0_states_list):
         for augmented_prod_index, dot_position in current_item_set:
@@ -73,43 +93,69 @@ def build_slr1_table(grammar_object, follow_sets_dict, lr0_states_list, lr0_goto
             if dot_position < len(rhs_tuple) and rhs_tuple != ('e',):
                 symbol_after_dot =rhs_tuple[dot_position]
                 goto_lookup_key = (state_index, symbol_after_dot)
-                if goto_lookup_key in lr0_goto_map:
-                    target_state_index = lr0_goto_map[goto_lookup_key]
-                    if symbol_after_dot in grammar_object.terminals:
-                        action_table_key = (state_index, symbol_after_dot)
-                        current_table_action = action_table.get(action_table_key)
-                        new_action_tuple = ('shift', target_state_index)
-                        if current_table_action and current_table_action != new_action_tuple:
-                            is_slr1_grammar=False; conflict_detected=True; action_table[action_table_key]=('error','S/R or S/S Conflict')
-                        elif not current_table_action or current_table_action[0] != 'error':
-                            action_table[action_table_key] = new_action_tuple
+                if goto_lookup_key in lr0_goto_map and symbol_after_dot in grammar_object.terminals:
+                    add_candidate_action((state_index, symbol_after_dot), ('shift', lr0_goto_map[goto_lookup_key]))
             elif dot_position == len(rhs_tuple) or rhs_tuple == ('e',):
                 if is_augmented_prod:
-                     action_table_key = (state_index, '$')
-                     current_table_action =action_table.get(action_table_key)
-                     new_action_tuple =('accept', None)
-                     if current_table_action and current_table_action != new_action_tuple:
-                         is_slr1_grammar=False; conflict_detected=True; action_table[action_table_key]=('error','Accept Conflict')
-                     elif not current_table_action or current_table_action[0] != 'error':
-                         action_table[action_table_key] = new_action_tuple
+                    add_candidate_action((state_index, '$'), ('accept', None))
                 else:
-                    follow_of_A = follow_sets_dict.get(nonterminal_head, set())
-                    for lookahead_terminal in follow_of_A:
-                        action_table_key =(state_index, lookahead_terminal)
-                        current_table_action = action_table.get(action_table_key)
-                        new_action_tuple = ('reduce', original_prod_index)
-                        if current_table_action and current_table_action != new_action_tuple:
-                            is_slr1_grammar=False; conflict_detected=True
-                            error_type = 'S/R' if current_table_action[0]=='shift' else 'R/R'
-                            action_table[action_table_key]=('error',f'{error_type} Conflict')
-                        elif not current_table_action or current_table_action[0] != 'error':
-                            action_table[action_table_key] = new_action_tuple
+                    for lookahead_terminal in follow_sets_dict.get(nonterminal_head, set()):
+                        add_candidate_action((state_index, lookahead_terminal), ('reduce', original_prod_index))
+
+    for action_table_key, candidate_actions_list in candidate_actions_map.items():
+        if len(candidate_actions_list) == 1:
+            action_table[action_table_key] = candidate_actions_list[0]
+            continue
+        action_types = [action_tuple[0] for action_tuple in candidate_actions_list]
+        resolved_action = None
+        if action_types.count('shift') == 1 and action_types.count('reduce') == 1 and len(action_types) == 2:
+            shift_action = candidate_actions_list[action_types.index('shift')]
+            reduce_action = candidate_actions_list[action_types.index('reduce')]
+            resolved_action = resolve_shift_reduce_conflict(grammar_object, action_table_key[1], shift_action, reduce_action)
+        if resolved_action is not None:
+            action_table[action_table_key] = resolved_action
+            continue
+        is_slr1_grammar = False
+        if 'accept' in action_types: error_type = 'Accept'
+        elif action_types.count('reduce') > 1: error_type = 'R/R'
+        else: error_type = 'S/R'
+        action_table[action_table_key] = ('error', f'{error_type} Conflict')
 
     for (from_state_index, grammar_symbol), to_state_index in lr0_goto_map.items():
         if grammar_symbol in grammar_object.nonterminals:
             goto_table[(from_state_index, grammar_symbol)] = to_state_index
 
-    return action_table, goto_table,is_slr1_grammar and not conflict_detected
+    return action_table, goto_table,is_slr1_grammar
+
+def slr1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, action_table_arg, goto_table_arg):
+    """performs one move of the slr(1) parser on parsing_stack (modified in place).
+    returns 'shift' when the current token was shifted, 'continue' after a reduction,
+    'accept' or 'reject' when the parse is finished."""
+    if not parsing_stack: return 'reject'
+    current_state = parsing_stack[-1]
+    current_input_symbol = token_list[input_pointer] if input_pointer < len(token_list) else '$'
+    action_tuple = action_table_arg.get((current_state, current_input_symbol))
+    if action_tuple is None: return 'reject'
+
+    action_type, action_value = action_tuple[0], action_tuple[1]
+    if action_type == 'shift':
+        parsing_stack.append(current_input_symbol)
+        parsing_stack.append(action_value)
+        return 'shift'
+    if action_type == 'reduce':
+        nonterminal_head, rhs_tuple = grammar_object.original_productions_list[action_value]
+        pop_item_count = len(rhs_tuple) * 2 if rhs_tuple != ('e',) else 0
+        if len(parsing_stack) <= pop_item_count: return 'reject'
+        if pop_item_count > 0:
+            del parsing_stack[-pop_item_count:]
+        next_state_index = goto_table_arg.get((parsing_stack[-1], nonterminal_head))
+        if next_state_index is None: return 'reject'
+        parsing_stack.append(nonterminal_head)
+        parsing_stack.append(next_state_index)
+        return 'continue'
+    if action_type == 'accept':
+        return 'accept' if input_pointer == len(token_list) - 1 else 'reject'
+    return 'reject'
 
 def parse_slr1(input_string, grammar_object,action_table_arg, goto_table_arg):
     token_list = []
@@ -120,50 +166,18 @@ def parse_slr1(input_string, grammar_object,action_table_arg, goto_table_arg):
     input_pointer = 0
 
     while True:
-        if not parsing_stack: return False
-        current_state = parsing_stack[-1]
-        current_input_symbol = token_list[input_pointer] if input_pointer < len(token_list) else '$'
-        action_table_key = (current_state, current_input_symbol)
-        action_tuple = action_table_arg.get(action_table_key)
-
-        if action_tuple is None: return False
-
-        action_type, action_value = action_tuple[0], action_tuple[1]
-
-        if action_type == 'shift':
-            next_state_index = action_value
-            parsing_stack.append(current_input_symbol)
-            parsing_stack.append(next_state_index)
-            input_pointer += 1
-        elif action_type == 'reduce':
-            production_index = action_value
-            nonterminal_head, rhs_tuple = grammar_object.original_productions_list[production_index]
-            pop_item_count = 0
-            if rhs_tuple != ('e',):
-                pop_item_count = len(rhs_tuple) * 2
-            
-            # Ensure stack has enough elements to pop for states and symbols
-            if len(parsing_stack) < pop_item_count: # Should be at least pop_item_count elements to remove
-                 return False # Stack underflow if trying to pop more than available
-            
-            # If pop_item_count is 0 (for A->e), stack remains, previous_state is current_state
-            if pop_item_count > 0:
-                parsing_stack = parsing_stack[:-pop_item_count]
-            
-            if not parsing_stack: return False # Should not happen if s0 is always there
-
-            previous_state_index = parsing_stack[-1]
-            
-            goto_table_key = (previous_state_index, nonterminal_head)
-            next_state_index = goto_table_arg.get(goto_table_key)
-            
-            if next_state_index is None: return False
-            
-            parsing_stack.append(nonterminal_head)
-            parsing_stack.append(next_state_index)
-        elif action_type == 'accept':
-            return input_pointer == len(token_list) - 1
-        elif action_type == 'error':
-            return False
-        else:
-            return False
\ No newline at end of file
+        step_outcome = slr1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, action_table_arg, goto_table_arg)
+        if step_outcome == 'shift': input_pointer += 1
+        elif step_outcome != 'continue': return step_outcome == 'accept'
+
+def count_slr1_reductions(input_string, grammar_object, action_table_arg, goto_table_arg):
+    """parses input_string and returns (accepted, number of reductions, number of input tokens)."""
+    token_list = list(input_string.strip()) + ['$']
+    parsing_stack = [0]
+    input_pointer = 0
+    reduction_count = 0
+    while True:
+        step_outcome = slr1_parse_step(parsing_stack, token_list, input_pointer, grammar_object, action_table_arg, goto_table_arg)
+        if step_outcome == 'shift': input_pointer += 1
+        elif step_outcome == 'continue': reduction_count += 1
+        else: return step_outcome == 'accept', reduction_count, len(token_list) - 1
@@ -0,0 +1,109 @@
+# test_incremental.py
+# checks the incremental parsers against full parses of the sample grammars. run with: python -m pytest
+import os
+import random
+from grammar import parse_grammar_from_file
+from first_follow import compute_first_sets, compute_follow_sets
+from ll1 import build_ll1_table, parse_ll1
+from slr1 import build_lr0_items, build_slr1_table, parse_slr1
+from incremental import DEFAULT_CHECKPOINT_INTERVAL, create_ll1_incremental_parser, create_slr1_incremental_parser
+
+SAMPLE_GRAMMAR_FILES = ['grammar1.txt', 'grammar2.txt', 'grammarplus1.txt', 'grammar4.txt']
+#a single small edit may re-parse up to one checkpoint interval before it and one after it
+LOCAL_EDIT_TOKEN_LIMIT = 2 * DEFAULT_CHECKPOINT_INTERVAL + 2
+
+def load_parsers(file_name):
+    """returns [(incremental parser factory, full parse function)] for the parsers the grammar supports."""
+    grammar_object = parse_grammar_from_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name))
+    first_sets_dict = compute_first_sets(grammar_object)
+    follow_sets_dict = compute_follow_sets(grammar_object, first_sets_dict)
+    ll1_parsing_table, is_ll1 = build_ll1_table(grammar_object, first_sets_dict, follow_sets_dict)
+    lr0_states_list, lr0_goto_map, augmented_list = build_lr0_items(grammar_object)
+    action_table, goto_table, is_slr1 = build_slr1_table(grammar_object, follow_sets_dict, lr0_states_list, lr0_goto_map, augmented_list)
+    parsers = []
+    if is_ll1:
+        parsers.append((lambda interval=DEFAULT_CHECKPOINT_INTERVAL: create_ll1_incremental_parser(grammar_object, ll1_parsing_table, interval),
+                        lambda text: parse_ll1(text, grammar_object, ll1_parsing_table)))
+    if is_slr1:
+        parsers.append((lambda interval=DEFAULT_CHECKPOINT_INTERVAL: create_slr1_incremental_parser(grammar_object, action_table, goto_table, interval),
+                        lambda text: parse_slr1(text, grammar_object, action_table, goto_table)))
+    return grammar_object, parsers
+
+def generate_sentence(grammar_object, symbol, random_generator, depth=0):
+    if symbol not in grammar_object.nonterminals: return '' if symbol == 'e' else symbol
+    alternatives = grammar_object.productions_map[symbol]
+    if depth > 6: alternatives = sorted(alternatives, key=len)[:1]
+    return ''.join(generate_sentence(grammar_object, rhs_symbol, random_generator, depth + 1)
+                   for rhs_symbol in random_generator.choice(alternatives))
+
+def test_apply_edit_matches_full_parse():
+    random_generator = random.Random(26)
+    for file_name in SAMPLE_GRAMMAR_FILES:
+        grammar_object, parsers = load_parsers(file_name)
+        assert parsers, file_name
+        alphabet = sorted(grammar_object.terminals - {'$'})
+        for make_incremental_parser, full_parse in parsers:
+            for _ in range(40):
+                incremental_parser = make_incremental_parser(random_generator.choice([1, 2, 4]))
+                text = generate_sentence(grammar_object, grammar_object.start_symbol, random_generator)
+                assert incremental_parser.parse(text) == full_parse(text)
+                for _ in range(30):
+                    edit_start = random_generator.randint(0, len(text))
+                    edit_end = random_generator.randint(edit_start, min(len(text), edit_start + 2))
+                    if random_generator.random() < 0.5:
+                        replacement_text = ''.join(random_generator.choice(alphabet) for _ in range(random_generator.randint(0, 2)))
+                    else:
+                        replacement_text = text[edit_start:edit_end]
+                    text = text[:edit_start] + replacement_text + text[edit_end:]
+                    assert incremental_parser.apply_edit(edit_start, edit_end, replacement_text) == full_parse(text), (file_name, text)
+
+def test_local_edit_reparses_few_tokens():
+    for file_name, operand in [('grammar4.txt', 'i'), ('grammarplus1.txt', 'd')]:
+        grammar_object, parsers = load_parsers(file_name)
+        text = '+'.join([operand + '*' + operand] * 5000)
+        for make_incremental_parser, full_parse in parsers:
+            incremental_parser = make_incremental_parser()
+            assert incremental_parser.parse(text)
+            middle = len(text) // 2 // 4 * 4
+            #replace one operand so the edit does not change the number of list elements after it
+            assert incremental_parser.apply_edit(middle, middle + 1, '(' + operand + '+' + operand + ')')
+            assert incremental_parser.last_reparsed_token_count <= LOCAL_EDIT_TOKEN_LIMIT
+
+def test_invalid_then_fixed_edit_stays_local():
+    for file_name, operand in [('grammar4.txt', 'i'), ('grammarplus1.txt', 'd')]:
+        grammar_object, parsers = load_parsers(file_name)
+        text = '+'.join([operand + '*' + operand] * 5000)
+        for make_incremental_parser, full_parse in parsers:
+            incremental_parser = make_incremental_parser()
+            assert incremental_parser.parse(text)
+            assert not incremental_parser.apply_edit(4, 5, '(')
+            assert incremental_parser.last_reparsed_token_count <= LOCAL_EDIT_TOKEN_LIMIT
+            assert incremental_parser.apply_edit(4, 5, operand)
+            assert incremental_parser.last_reparsed_token_count <= LOCAL_EDIT_TOKEN_LIMIT
+
+def test_deeply_nested_edit_stays_local():
+    grammar_object, parsers = load_parsers('grammar1.txt')
+    make_incremental_parser, full_parse = parsers[0]
+    incremental_parser = make_incremental_parser()
+    assert incremental_parser.parse('(' * 8000 + 'i' + ')' * 8000)
+    assert incremental_parser.apply_edit(8000, 8001, 'i+i')
+    assert incremental_parser.last_reparsed_token_count <= LOCAL_EDIT_TOKEN_LIMIT
+
+def test_edit_bookkeeping_does_not_grow_with_input():
+    grammar_object, parsers = load_parsers('grammar4.txt')
+    make_incremental_parser, full_parse = parsers[0]
+    touched_counts = []
+    for term_count in [1000, 10000]:
+        incremental_parser = make_incremental_parser()
+        text = '+'.join(['i*i'] * term_count)
+        assert incremental_parser.parse(text)
+        middle = len(text) // 2 // 4 * 4
+        #the first edit moves the gap from the end of the input to the middle
+        assert incremental_parser.apply_edit(middle, middle + 1, 'i')
+        most_touched = 0
+        for edit_number in range(20):
+            if edit_number % 2 == 0: assert incremental_parser.apply_edit(middle, middle + 1, '(i+i)')
+            else: assert incremental_parser.apply_edit(middle, middle + 5, 'i')
+            most_touched = max(most_touched, incremental_parser.last_touched_checkpoint_count)
+        touched_counts.append(most_touched)
+    assert touched_counts[0] == touched_counts[1] <= 2 * LOCAL_EDIT_TOKEN_LIMIT // DEFAULT_CHECKPOINT_INTERVAL + 2
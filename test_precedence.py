@@ -0,0 +1,107 @@
+# test_precedence.py
+# checks the precedence declarations and the slr(1) table construction. run with: python -m pytest
+import os
+import hashlib
+import pytest
+from grammar import parse_grammar_from_file
+from first_follow import compute_first_sets, compute_follow_sets
+from slr1 import build_lr0_items, build_slr1_table, parse_slr1
+
+GRAMMAR_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+#(is slr(1), lr(0) states, action entries, goto entries, table fingerprint) of the grammars without
+#precedence declarations, recorded from the tables built before precedence support was added
+BASELINE_TABLES = {
+    'grammar1.txt': (True, 12, 36, 9, '1ebad8178d0d52d5'),
+    'grammar2.txt': (True, 10, 19, 5, '7cedc304d86957b8'),
+    'grammar3.txt': (False, 4, 4, 2, '4ff895b8f93af1f4'),
+    'grammarplus1.txt': (True, 16, 42, 13, '5fb628d64477c88f'),
+}
+
+def build_tables(grammar_object):
+    follow_sets_dict = compute_follow_sets(grammar_object, compute_first_sets(grammar_object))
+    lr0_states_list, lr0_goto_map, augmented_list = build_lr0_items(grammar_object)
+    action_table, goto_table, is_slr1 = build_slr1_table(grammar_object, follow_sets_dict, lr0_states_list, lr0_goto_map, augmented_list)
+    return lr0_states_list, action_table, goto_table, is_slr1
+
+def load_grammar_text(tmp_path, grammar_text):
+    grammar_path = tmp_path / 'grammar.txt'
+    grammar_path.write_text(grammar_text)
+    return parse_grammar_from_file(str(grammar_path))
+
+def table_fingerprint(lr0_states_list, action_table, goto_table):
+    """hash of the tables that does not depend on the order the states were numbered in.
+    conflict entries only count as errors, since their labels used to depend on item order."""
+    state_key = lambda state_index: tuple(sorted(lr0_states_list[state_index]))
+    rows = []
+    for (state_index, terminal_symbol), (action_type, action_value) in action_table.items():
+        if action_type == 'shift': action_value = state_key(action_value)
+        elif action_type == 'error': action_value = None
+        rows.append(('A', state_key(state_index), terminal_symbol, action_type, action_value))
+    for (state_index, nonterminal_symbol), target_state_index in goto_table.items():
+        rows.append(('G', state_key(state_index), nonterminal_symbol, state_key(target_state_index)))
+    return hashlib.sha256(repr(sorted(rows, key=repr)).encode()).hexdigest()[:16]
+
+def completed_item_state(lr0_states_list, original_production_index, rhs_length):
+    """index of the state holding the completed item of the given production."""
+    for state_index, item_set in enumerate(lr0_states_list):
+        if (original_production_index + 1, rhs_length) in item_set:
+            return state_index
+    raise AssertionError("no state with the completed item")
+
+def test_tables_without_precedence_are_unchanged():
+    for file_name, expected_summary in BASELINE_TABLES.items():
+        grammar_object = parse_grammar_from_file(os.path.join(GRAMMAR_DIRECTORY, file_name))
+        lr0_states_list, action_table, goto_table, is_slr1 = build_tables(grammar_object)
+        summary = (is_slr1, len(lr0_states_list), len(action_table), len(goto_table),
+                   table_fingerprint(lr0_states_list, action_table, goto_table))
+        assert summary == expected_summary, file_name
+
+def test_left_precedence_resolves_grammar4():
+    grammar_object = parse_grammar_from_file(os.path.join(GRAMMAR_DIRECTORY, 'grammar4.txt'))
+    lr0_states_list, action_table, goto_table, is_slr1 = build_tables(grammar_object)
+    assert is_slr1
+    #productions: 0: S -> S+S, 1: S -> S*S
+    sum_state = completed_item_state(lr0_states_list, 0, 3)
+    assert action_table[(sum_state, '+')] == ('reduce', 0)
+    assert action_table[(sum_state, '*')][0] == 'shift'
+    product_state = completed_item_state(lr0_states_list, 1, 3)
+    assert action_table[(product_state, '+')] == ('reduce', 1)
+    assert action_table[(product_state, '*')] == ('reduce', 1)
+    for accepted_string in ['i+i*i', 'i*i+i', '(i+i)*i', 'i']:
+        assert parse_slr1(accepted_string, grammar_object, action_table, goto_table)
+    for rejected_string in ['i+', 'ii', '(i', '']:
+        assert not parse_slr1(rejected_string, grammar_object, action_table, goto_table)
+
+def test_right_precedence_shifts(tmp_path):
+    grammar_object = load_grammar_text(tmp_path, "1\nS -> S+S i\n%right +\n")
+    lr0_states_list, action_table, goto_table, is_slr1 = build_tables(grammar_object)
+    assert is_slr1
+    assert action_table[(completed_item_state(lr0_states_list, 0, 3), '+')][0] == 'shift'
+    assert parse_slr1('i+i+i', grammar_object, action_table, goto_table)
+
+def test_nonassoc_precedence_rejects_chains(tmp_path):
+    grammar_object = load_grammar_text(tmp_path, "1\nS -> SaS i\n%nonassoc a\n")
+    lr0_states_list, action_table, goto_table, is_slr1 = build_tables(grammar_object)
+    assert is_slr1
+    assert action_table[(completed_item_state(lr0_states_list, 0, 3), 'a')] == ('error', 'Nonassoc')
+    assert parse_slr1('iai', grammar_object, action_table, goto_table)
+    assert not parse_slr1('iaiai', grammar_object, action_table, goto_table)
+
+def test_undeclared_operator_still_conflicts(tmp_path):
+    grammar_object = load_grammar_text(tmp_path, "1\nS -> S+S S*S i\n%left +\n")
+    lr0_states_list, action_table, goto_table, is_slr1 = build_tables(grammar_object)
+    assert not is_slr1
+    assert action_table[(completed_item_state(lr0_states_list, 0, 3), '*')] == ('error', 'S/R Conflict')
+
+@pytest.mark.parametrize("grammar_text, expected_message", [
+    ("2\nS -> S+S i\n%left +\nT -> i\n", "before all 2 production lines"),
+    ("1\nS -> S+S i\n%bogus +\n", "Unknown associativity 'bogus'"),
+    ("1\nS -> S+S S*S i\n%left +\n%right + *\n", "declared more than once"),
+    ("1\nS -> S+S i\n%left b\n", "not a terminal of the grammar"),
+    ("1\nS -> S+S S*S i\n%left +\nstray\n%left *\n", "Unexpected line 'stray'"),
+    ("1\nS -> S+S i\n%left\n", "without terminals"),
+])
+def test_invalid_precedence_declarations(tmp_path, grammar_text, expected_message):
+    with pytest.raises(RuntimeError, match=expected_message):
+        load_grammar_text(tmp_path, grammar_text)